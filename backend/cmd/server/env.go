@@ -35,7 +35,7 @@ func loadEnv(envpath string) serverConfig {
 		slog.Info("Using .env file as environment variable.")
 	}
 	concurrency := tryLoadEnvInt("CONCURRENCY_LIMIT", 10)
-	exts := tryLoadEnvStringList("SUPPORTED_EXTENSIONS", defaultExts)
+	exts := normalizeExtensions(tryLoadEnvStringList("SUPPORTED_EXTENSIONS", defaultExts))
 	origins := tryLoadEnvStringList("ALLOWED_ORIGINS", []string{"*"})
 	logLevel := parseLogLevel(os.Getenv("LOG_LEVEL"), slog.LevelInfo)
 
@@ -47,6 +47,20 @@ func loadEnv(envpath string) serverConfig {
 	}
 }
 
+// normalizeExtensions lowercases extensions and ensures a leading dot,
+// so "MKV" or "mkv" match what filepath.Ext returns (".mkv")
+func normalizeExtensions(exts []string) []string {
+	out := make([]string, 0, len(exts))
+	for _, ext := range exts {
+		ext = strings.ToLower(ext)
+		if !strings.HasPrefix(ext, ".") {
+			ext = "." + ext
+		}
+		out = append(out, ext)
+	}
+	return out
+}
+
 // parseLogLevel converts a string log level to slog.Level
 // Returns defaultLevel if the string is empty or invalid
 func parseLogLevel(levelStr string, defaultLevel slog.Level) slog.Level {
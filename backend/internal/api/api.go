@@ -14,11 +14,12 @@ type Handler struct {
 	Watcher *watcher_manager.Manager
 	Context context.Context
 
+	scannerMutex      sync.RWMutex // protect scanner, replaced on every /start
 	scanner           *plex.Scanner
-	scanSemaphore     chan struct{}   // limit concurrent scans
-	activeScansMutex  sync.Mutex      // protect activeScans map
-	activeScans       map[string]bool // track paths currently being scanned
-	allowedExtensions []string
+	scanSemaphore     chan struct{}       // limit concurrent scans
+	activeScansMutex  sync.Mutex          // protect activeScans map
+	activeScans       map[string]struct{} // track paths currently being scanned
+	allowedExtensions map[string]struct{} // lowercase extensions, built once for O(1) lookup
 }
 
 // NewHandler creates a new API handler with the specified concurrency limit for scans.
@@ -31,11 +32,48 @@ func NewHandler(ctx context.Context, concurrency int, allowedExtensions []string
 		Watcher:           watcher_manager.NewManager(),
 		Context:           ctx,
 		scanSemaphore:     make(chan struct{}, concurrency), // limit to specified concurrent scans
-		activeScans:       make(map[string]bool),            // initialize deduplication map
-		allowedExtensions: allowedExtensions,
+		activeScans:       make(map[string]struct{}),        // initialize deduplication map
+		allowedExtensions: newExtSet(allowedExtensions),
 	}
 }
 
+// getScanner returns the scanner of the current watch session (nil before /start).
+func (h *Handler) getScanner() *plex.Scanner {
+	h.scannerMutex.RLock()
+	defer h.scannerMutex.RUnlock()
+	return h.scanner
+}
+
+func (h *Handler) setScanner(s *plex.Scanner) {
+	h.scannerMutex.Lock()
+	h.scanner = s
+	h.scannerMutex.Unlock()
+}
+
+// isMediaFile reports whether path has one of the allowed media extensions and is not hidden.
+// Used as the watcher filter so other events are dropped before debouncing.
+func (h *Handler) isMediaFile(path string) bool {
+	return ensureExtAllowed(path, h.allowedExtensions) && !isHiddenFile(path)
+}
+
+// dispatchScan triggers a Plex scan of p in the background, bounded by scanSemaphore.
+// onDone (optional) runs once the scan has finished, successful or not.
+func (h *Handler) dispatchScan(scanner *plex.Scanner, p string, onDone func()) {
+	go func() {
+		h.scanSemaphore <- struct{}{}        // acquire a token
+		defer func() { <-h.scanSemaphore }() // release the token
+		if onDone != nil {
+			defer onDone()
+		}
+
+		if section, err := scanner.ScanPath(h.Context, p); err != nil {
+			slog.Error("scan failed", "scan_target", p, "error", err)
+		} else {
+			slog.Info("scan triggered", "scan_target", p, "section", section.SectionTitle)
+		}
+	}()
+}
+
 // RegisterRoutes sets up the HTTP routes for the API.
 func (h *Handler) RegisterRoutes(mux *http.ServeMux) {
 	mux.HandleFunc("/", h.root)
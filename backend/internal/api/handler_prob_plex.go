@@ -1,7 +1,6 @@
 package api
 
 import (
-	"log"
 	"log/slog"
 	"net/http"
 	"plexwatcher/internal/plex"
@@ -20,14 +19,14 @@ func (h *Handler) probPlex(w http.ResponseWriter, r *http.Request) {
 	serverUrl := params.Get("server_url")
 	if serverUrl == "" {
 		response.WriteError(w, "missing 'server_url' query parameter", http.StatusBadRequest)
-		log.Println("missing 'server_url' query parameter")
+		slog.Warn("missing 'server_url' query parameter")
 		return
 	}
 
 	token := params.Get("token")
 	if token == "" {
 		response.WriteError(w, "missing 'token' query parameter", http.StatusBadRequest)
-		log.Println("missing 'token' query parameter")
+		slog.Warn("missing 'token' query parameter")
 		return
 	}
 
@@ -32,7 +32,7 @@ func (h *Handler) scan(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	// trigger scans for each path
-	uniquePaths := make(map[string]bool) // deduplicate scan paths
+	uniquePaths := make(map[string]struct{}) // deduplicate scan paths
 	scanPaths := []string{}
 
 	for _, path := range req.Paths {
@@ -63,27 +63,22 @@ func (h *Handler) scan(w http.ResponseWriter, r *http.Request) {
 		targetDir = filepath.ToSlash(targetDir)
 
 		// Deduplicate: only add if not already in the map
-		if !uniquePaths[targetDir] {
-			uniquePaths[targetDir] = true
+		if _, seen := uniquePaths[targetDir]; !seen {
+			uniquePaths[targetDir] = struct{}{}
 			scanPaths = append(scanPaths, targetDir)
 		} else {
 			slog.Debug("duplicate scan path detected and skipped", "path", targetDir)
 		}
 	}
 
+	// a scan of a parent dir already covers its children
+	scanPaths = pruneCovered(scanPaths, uniquePaths)
+
 	slog.Info("triggering scans for unique paths", "unique", len(scanPaths), "requested", len(req.Paths))
 
 	// Now trigger scans for unique paths
 	for _, targetDir := range scanPaths {
-		go func(p string, s *plex.Scanner) {
-			h.scanSemaphore <- struct{}{}        // acquire a token
-			defer func() { <-h.scanSemaphore }() // release the token
-			if section, err := s.ScanPath(h.Context, p); err != nil {
-				slog.Error("scan failed", "path", p, "error", err)
-			} else {
-				slog.Info("scan completed", "path", p, "section", section.SectionTitle)
-			}
-		}(targetDir, scanner)
+		h.dispatchScan(scanner, targetDir, nil)
 	}
 	response.WriteSuccess(w, "scanned triggered", nil, http.StatusOK)
 }
@@ -9,7 +9,6 @@ import (
 	"plexwatcher/internal/plex"
 	"plexwatcher/internal/response"
 	"plexwatcher/internal/types"
-	"strings"
 
 	"github.com/fsnotify/fsnotify"
 )
@@ -29,15 +28,16 @@ func (h *Handler) start(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 	// initialize scanner
-	h.scanner, err = plex.NewScanner(h.Context, plexClient)
+	scanner, err := plex.NewScanner(h.Context, plexClient)
 	if err != nil {
 		response.WriteError(w, err.Error(), http.StatusBadRequest)
 		slog.Error("failed to create Plex scanner", "error", err)
 		return
 	}
+	h.setScanner(scanner)
 
 	// log all root sections
-	for _, section := range h.scanner.GetAllSections() {
+	for _, section := range scanner.GetAllSections() {
 		slog.Info("Plex section",
 			"title", section.SectionTitle,
 			"type", section.SectionType,
@@ -46,7 +46,7 @@ func (h *Handler) start(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// start watcher
-	if err := h.Watcher.Start(req, h.handleDirUpdate); err != nil {
+	if err := h.Watcher.Start(req, h.handleDirUpdate, h.isMediaFile); err != nil {
 		response.WriteError(w, err.Error(), http.StatusBadRequest)
 		slog.Error("failed to start Plex watcher", "error", err)
 		return
@@ -61,26 +61,17 @@ func (h *Handler) start(w http.ResponseWriter, r *http.Request) {
 }
 
 func (h *Handler) handleDirUpdate(e fs_watcher.Event) {
-	logger := slog.With("path", e.Path)
-
 	if e.Err != nil {
-		logger.Error("watcher error", "error", e.Err)
+		slog.Error("watcher error", "error", e.Err)
 		return
 	}
 
-	// Filter: only process files with allowed extensions
-	// Directories have no extension and are automatically skipped
-	ext := strings.ToLower(filepath.Ext(e.Path))
-	if ext == "" {
-		logger.Debug("skipping directory or extensionless file", "path", e.Path)
-		return
-	}
-	if !ensureExtAllowed(e.Path, h.allowedExtensions) {
-		logger.Debug("disallowed extension, skipping event", "extension", ext)
-		return
-	}
+	// non-media paths (including directories) are already dropped by the watcher filter (isMediaFile)
+	logger := slog.With("path", e.Path)
 
-	if h.scanner == nil {
+	// snapshot the scanner once so a concurrent /start can't swap it mid-event
+	scanner := h.getScanner()
+	if scanner == nil {
 		logger.Warn("scanner not initialized, skipping event")
 		return
 	}
@@ -103,7 +94,7 @@ func (h *Handler) handleDirUpdate(e fs_watcher.Event) {
 	}
 
 	// First, map to Plex path to get section info
-	_, section := h.scanner.MapToPlexPath(e.Path)
+	_, section := scanner.MapToPlexPath(e.Path)
 	if section == nil {
 		logger.Warn("path does not map to any Plex library path, skipping scan")
 		return
@@ -111,10 +102,10 @@ func (h *Handler) handleDirUpdate(e fs_watcher.Event) {
 
 	// Calculate scan target on LOCAL path first (like Python does)
 	// This gets us to the item root (movie folder or show folder)
-	localScanTarget := h.scanner.GetScanPath(e.Path, section.SectionType)
+	localScanTarget := scanner.GetScanPath(e.Path, section.SectionType)
 
 	// Now map the calculated target to Plex path
-	plexScanTarget, mappedSection := h.scanner.MapToPlexPath(localScanTarget)
+	plexScanTarget, mappedSection := scanner.MapToPlexPath(localScanTarget)
 	if mappedSection == nil || plexScanTarget == "" {
 		logger.Warn("failed to map scan target to Plex path, skipping scan",
 			"local_scan_target", localScanTarget)
@@ -122,32 +113,24 @@ func (h *Handler) handleDirUpdate(e fs_watcher.Event) {
 	}
 	targetDir := filepath.ToSlash(plexScanTarget) // normalize to forward slashes for Plex
 
-	logger.Info("file event detected, queuing scan", "scan_target", targetDir, "event", eventType)
-
-	// Check if this path is already being scanned (deduplication)
+	// Check if this path (or a parent dir, which Plex scans recursively) is already being scanned (deduplication)
 	h.activeScansMutex.Lock()
-	if h.activeScans[targetDir] {
+	if hasAncestorIn(targetDir, h.activeScans) {
 		h.activeScansMutex.Unlock()
+		logger.Debug("file event detected, scan already queued", "scan_target", targetDir, "event", eventType)
 		return
 	}
 	// Mark this path as being scanned
-	h.activeScans[targetDir] = true
+	h.activeScans[targetDir] = struct{}{}
 	h.activeScansMutex.Unlock()
 
-	// trigger plex scan
-	go func(p string) {
-		h.scanSemaphore <- struct{}{}        // acquire a token
-		defer func() { <-h.scanSemaphore }() // release the token
-
-		if section, err := h.scanner.ScanPath(h.Context, p); err != nil {
-			slog.Error("scan failed", "scan_target", targetDir, "error", err)
-		} else {
-			slog.Info("scan triggered", "scan_target", targetDir, "section", section.SectionTitle)
-		}
+	// only the event that actually queues a scan logs at INFO; bursts would otherwise flood the log
+	logger.Info("file event detected, queuing scan", "scan_target", targetDir, "event", eventType)
 
-		// Remove from active scans when done
+	// trigger plex scan, remove from active scans when done
+	h.dispatchScan(scanner, targetDir, func() {
 		h.activeScansMutex.Lock()
-		delete(h.activeScans, p)
+		delete(h.activeScans, targetDir)
 		h.activeScansMutex.Unlock()
-	}(targetDir)
+	})
 }
@@ -23,8 +23,8 @@ func (h *Handler) status(w http.ResponseWriter, r *http.Request) {
 	)
 
 	var serverURL *string
-	if h.scanner != nil {
-		url := h.scanner.GetPlexClient().BaseURL.String()
+	if scanner := h.getScanner(); scanner != nil {
+		url := scanner.GetPlexClient().BaseURL.String()
 		serverURL = &url
 	}
 
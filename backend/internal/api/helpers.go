@@ -1,16 +1,56 @@
 package api
 
 import (
+	"path"
 	"path/filepath"
 	"strings"
 )
 
-func ensureExtAllowed(path string, allowedExts []string) bool {
-	ext := strings.ToLower(filepath.Ext(path))
-	for _, allowExt := range allowedExts {
-		if ext == allowExt {
+// newExtSet builds a lookup set of lowercase extensions.
+func newExtSet(exts []string) map[string]struct{} {
+	set := make(map[string]struct{}, len(exts))
+	for _, ext := range exts {
+		set[strings.ToLower(ext)] = struct{}{}
+	}
+	return set
+}
+
+func ensureExtAllowed(path string, allowedExts map[string]struct{}) bool {
+	_, ok := allowedExts[strings.ToLower(filepath.Ext(path))]
+	return ok
+}
+
+// isHiddenFile reports whether the file name starts with a dot, e.g. macOS "._movie.mkv"
+// resource forks or in-progress sync temp files, which carry media extensions but aren't media.
+func isHiddenFile(path string) bool {
+	return strings.HasPrefix(filepath.Base(path), ".")
+}
+
+// hasAncestorIn reports whether set contains p itself or any of its parent directories.
+// p must be a Plex path (forward slashes).
+func hasAncestorIn(p string, set map[string]struct{}) bool {
+	for {
+		if _, ok := set[p]; ok {
 			return true
 		}
+		parent := path.Dir(p)
+		if parent == p || parent == "." {
+			return false
+		}
+		p = parent
+	}
+}
+
+// pruneCovered drops paths whose parent directory is also in set,
+// since Plex scans a directory recursively the parent scan already covers them.
+func pruneCovered(paths []string, set map[string]struct{}) []string {
+	out := paths[:0]
+	for _, p := range paths {
+		parent := path.Dir(p)
+		if parent != p && hasAncestorIn(parent, set) {
+			continue
+		}
+		out = append(out, p)
 	}
-	return false
+	return out
 }
@@ -7,6 +7,7 @@ import (
 	"log/slog"
 	"os"
 	"path/filepath"
+	"strings"
 	"sync"
 	"sync/atomic"
 	"time"
@@ -14,6 +15,23 @@ import (
 	"github.com/fsnotify/fsnotify"
 )
 
+const (
+	// writeThrottleWindow suppresses repeated WRITE events for the same path when
+	// debouncing is disabled (copies and editors emit long trains of them)
+	writeThrottleWindow = time.Second
+	// maxRecentWrites bounds the memory used to track recent WRITE events
+	maxRecentWrites = 4096
+	// eventBufferSize lets the fsnotify reader keep draining the kernel queue while the
+	// run loop is busy (e.g. walking a newly created tree), avoiding inotify overflows
+	eventBufferSize = 4096
+	// maxPendingEvents caps the debounce backlog; a burst larger than this is flushed
+	// early instead of growing without bound until the window goes quiet
+	maxPendingEvents = 10000
+)
+
+// errStopped is returned by long-running setup work aborted by Stop.
+var errStopped = errors.New("watcher stopped")
+
 // Event is a thin wrapper over fsnotify.Event, extend later without breaking API
 type Event struct {
 	Path string
@@ -38,6 +56,10 @@ type Config struct {
 
 	// Hnadler receives events. Must be non-nil.
 	Handler Handler
+
+	// Filter, if set, drops events whose path it rejects before they are
+	// debounced or handed to Handler. New dirs are still watched when Recursive.
+	Filter func(path string) bool
 }
 
 type PlexWatcher struct {
@@ -50,6 +72,9 @@ type PlexWatcher struct {
 
 	waitGroup sync.WaitGroup
 	stop      chan struct{} // closed to signal shutdown
+
+	watchedMutex sync.Mutex
+	watched      map[string]struct{} // dirs with an active fsnotify watch
 }
 
 // Create a new watcher. Call Start(ctx) to start watching.
@@ -60,14 +85,15 @@ func NewPlexWatcher(cfg Config) (*PlexWatcher, error) {
 	if cfg.Handler == nil {
 		return nil, errors.New("handler must be provided")
 	}
-	watcher, err := fsnotify.NewWatcher()
+	watcher, err := fsnotify.NewBufferedWatcher(eventBufferSize)
 	if err != nil {
-		return nil, fmt.Errorf("fsnotify.NewWatcher: %w", err)
+		return nil, fmt.Errorf("fsnotify.NewBufferedWatcher: %w", err)
 	}
 	pw := &PlexWatcher{
 		cfg:     cfg,
 		watcher: watcher,
 		stop:    make(chan struct{}),
+		watched: make(map[string]struct{}),
 	}
 	return pw, nil
 }
@@ -77,9 +103,8 @@ func NewPlexWatcher(cfg Config) (*PlexWatcher, error) {
 // ====================
 
 // GetConfig returns the current configuration of the PlexWatcher.
+// cfg is never modified after NewPlexWatcher, so no locking is needed.
 func (pw *PlexWatcher) GetConfig() Config {
-	pw.mutex.Lock()
-	defer pw.mutex.Unlock()
 	return pw.cfg
 }
 
@@ -106,6 +131,7 @@ func (pw *PlexWatcher) Start(ctx context.Context) error {
 		if err := pw.watcher.Add(dir); err != nil {
 			return fmt.Errorf("watcher.Add(%s): %w", dir, err)
 		}
+		pw.markWatched(dir)
 	}
 
 	// start the main run loop
@@ -119,7 +145,9 @@ func (pw *PlexWatcher) Start(ctx context.Context) error {
 			go func(dirToScan string) {
 				slog.Info("starting recursive directory watch setup in background", "path", dirToScan)
 				startTime := time.Now()
-				if err := pw.addRecursive(dirToScan); err != nil {
+				if err := pw.addRecursive(dirToScan); errors.Is(err, errStopped) {
+					slog.Info("recursive directory watch setup aborted, watcher stopped", "path", dirToScan)
+				} else if err != nil {
 					slog.Error("failed to perform recursive watch setup", "path", dirToScan, "error", err)
 				} else {
 					elapsed := time.Since(startTime)
@@ -157,57 +185,83 @@ func (pw *PlexWatcher) run(ctx context.Context) {
 	defer pw.watcher.Close()
 
 	var (
-		debounce = pw.cfg.DebounceWindow
-		timer    *time.Timer
-		pending  = make(map[string]fsnotify.Op) // path -> accumulated ops
+		debounce  = pw.cfg.DebounceWindow
+		timer     *time.Timer
+		timerC    <-chan time.Time               // nil while disarmed, so the select case never fires
+		lastEvent time.Time                      // time of the most recent accumulated event
+		pending   = make(map[string]fsnotify.Op) // path -> accumulated ops
+		recent    = make(map[string]time.Time)   // path -> last delivered WRITE (debounce disabled only)
 	)
 
 	flush := func() {
 		if len(pending) == 0 {
 			return
 		}
-		for p, op := range pending {
+		// swap before dispatching so the batch handed to the handler is never mutated
+		batch := pending
+		pending = make(map[string]fsnotify.Op)
+		for p, op := range batch {
 			pw.cfg.Handler(Event{
 				Path: p,
 				Op:   op,
 			})
 		}
-		pending = make(map[string]fsnotify.Op)
 	}
 
-	// Initialize timer as stopped if debouncing is enabled
-	if debounce > 0 {
-		timer = time.NewTimer(debounce)
+	discard := func() {
+		if len(pending) > 0 {
+			slog.Debug("watcher stopped, discarding pending events", "count", len(pending))
+		}
+		pending = nil
+	}
+
+	// throttled reports whether a pure WRITE event repeats one delivered within writeThrottleWindow
+	throttled := func(event fsnotify.Event) bool {
+		if event.Op != fsnotify.Write {
+			return false
+		}
+		now := time.Now()
+		if last, ok := recent[event.Name]; ok && now.Sub(last) < writeThrottleWindow {
+			return true
+		}
+		if len(recent) >= maxRecentWrites {
+			for p, t := range recent {
+				if now.Sub(t) >= writeThrottleWindow {
+					delete(recent, p)
+				}
+			}
+			if len(recent) >= maxRecentWrites {
+				recent = make(map[string]time.Time) // still full of live entries, start over
+			}
+		}
+		recent[event.Name] = now
+		return false
+	}
+
+	// disarm stops the debounce timer (if armed) so it can be safely reset later
+	disarm := func() {
+		if timerC == nil {
+			return
+		}
 		if !timer.Stop() {
-			<-timer.C
+			select {
+			case <-timer.C:
+			default:
+			}
 		}
+		timerC = nil
 	}
 
 	for {
 		select {
 		case <-pw.stop:
-			// Stop timer and do final flush
-			if timer != nil {
-				if !timer.Stop() {
-					select {
-					case <-timer.C:
-					default:
-					}
-				}
-			}
-			flush()
+			// Stop timer and drop pending events; a stopped watcher must not trigger scans
+			disarm()
+			discard()
 			return
 		case <-ctx.Done():
-			// Stop timer and do final flush
-			if timer != nil {
-				if !timer.Stop() {
-					select {
-					case <-timer.C:
-					default:
-					}
-				}
-			}
-			flush()
+			disarm()
+			discard()
 			return
 		case err, ok := <-pw.watcher.Errors:
 			if !ok {
@@ -220,14 +274,24 @@ func (pw *PlexWatcher) run(ctx context.Context) {
 			}
 
 			if pw.cfg.Recursive && event.Op&fsnotify.Create == fsnotify.Create {
-				if isDir(event.Name) {
-					if err := pw.addRecursive(event.Name); err != nil {
-						slog.Error("failed to add new subdir", "path", event.Name, "error", err)
-					}
+				// no separate stat: WalkDir already lstats the root and adds nothing for files
+				if err := pw.addRecursive(event.Name); err != nil && !errors.Is(err, errStopped) {
+					slog.Error("failed to add new subdir", "path", event.Name, "error", err)
 				}
 			}
+			// fsnotify drops the watch of a removed/renamed dir; forget it so it can be re-added
+			if event.Op&(fsnotify.Remove|fsnotify.Rename) != 0 {
+				pw.unmarkWatched(event.Name)
+			}
+
+			if pw.cfg.Filter != nil && !pw.cfg.Filter(event.Name) {
+				continue
+			}
 
 			if debounce <= 0 {
+				if throttled(event) {
+					continue
+				}
 				pw.cfg.Handler(Event{Path: event.Name, Op: event.Op})
 				continue
 			}
@@ -236,16 +300,33 @@ func (pw *PlexWatcher) run(ctx context.Context) {
 			combined := pending[event.Name] | event.Op
 			pending[event.Name] = combined
 
-			// (re)arm timer
-			if !timer.Stop() {
-				select {
-				case <-timer.C: // drain if needed
-				default:
+			if len(pending) >= maxPendingEvents {
+				slog.Debug("debounce backlog full, flushing early", "count", len(pending))
+				disarm()
+				flush()
+				continue
+			}
+
+			// push the deadline forward; the timer is only armed once per burst
+			// and re-checks the deadline when it fires (no Stop/Reset per event)
+			lastEvent = time.Now()
+			if timerC == nil {
+				if timer == nil {
+					timer = time.NewTimer(debounce)
+				} else {
+					timer.Reset(debounce)
 				}
+				timerC = timer.C
 			}
-			timer.Reset(debounce)
-		case <-timer.C:
-			// Timer expired - flush accumulated events
+		case <-timerC:
+			timerC = nil
+			// events arrived after the timer was armed - wait out the remainder of the window
+			if remaining := debounce - time.Since(lastEvent); remaining > 0 {
+				timer.Reset(remaining)
+				timerC = timer.C
+				continue
+			}
+			// quiet for a full window - flush accumulated events
 			flush()
 		}
 	}
@@ -257,10 +338,14 @@ func (pw *PlexWatcher) run(ctx context.Context) {
 
 // add subdirs recursivesly with a root path
 // Uses parallel directory traversal for better performance on large directory trees
+// If root is not a directory, nothing is added.
 func (pw *PlexWatcher) addRecursive(root string) error {
 	// Collect all directories first (fast - just filesystem scan)
 	var dirs []string
 	err := filepath.WalkDir(root, func(path string, d os.DirEntry, err error) error {
+		if pw.stopped() {
+			return errStopped // walking a large tree can take minutes, don't outlive Stop
+		}
 		if err != nil {
 			slog.Debug("error accessing path during scan, skipping", "path", path, "error", err)
 			if d != nil && d.IsDir() {
@@ -268,7 +353,7 @@ func (pw *PlexWatcher) addRecursive(root string) error {
 			}
 			return nil
 		}
-		if d.IsDir() {
+		if d.IsDir() && !pw.isWatched(path) {
 			dirs = append(dirs, path)
 		}
 		return nil
@@ -277,46 +362,70 @@ func (pw *PlexWatcher) addRecursive(root string) error {
 		return err
 	}
 
+	if len(dirs) == 0 {
+		return nil // everything under root is already watched
+	}
+
 	slog.Debug("directories discovered, adding watches", "count", len(dirs), "root", root)
 
-	// add watches in parallel (slow - syscalls)
-	var wg sync.WaitGroup
-	workerCount := 32 // workers for syscall-bound operations
 	var addedCount int64
 	var failCount int64
 
-	// Create work chunks
-	chunkSize := (len(dirs) + workerCount - 1) / workerCount
-
-	for i := 0; i < workerCount; i++ {
-		start := i * chunkSize
-		if start >= len(dirs) {
-			break
-		}
-		end := start + chunkSize
-		if end > len(dirs) {
-			end = len(dirs)
+	addChunk := func(chunk []string) {
+		localAdded := 0
+		localFailed := 0
+		for _, dir := range chunk {
+			if pw.stopped() {
+				return
+			}
+			if err := pw.watcher.Add(dir); err != nil {
+				slog.Debug("failed to add watch", "path", dir, "error", err)
+				localFailed++
+			} else {
+				pw.markWatched(dir)
+				localAdded++
+			}
 		}
+		atomic.AddInt64(&addedCount, int64(localAdded))
+		atomic.AddInt64(&failCount, int64(localFailed))
+	}
 
-		wg.Add(1)
-		go func(chunk []string) {
-			defer wg.Done()
-			localAdded := 0
-			localFailed := 0
-			for _, dir := range chunk {
-				if err := pw.watcher.Add(dir); err != nil {
-					slog.Debug("failed to add watch", "path", dir, "error", err)
-					localFailed++
-				} else {
-					localAdded++
-				}
+	workerCount := 32 // workers for syscall-bound operations
+
+	if len(dirs) <= workerCount {
+		// small trees (typically a single new dir from a create event):
+		// one dir per goroutine isn't worth the spawn, add inline
+		addChunk(dirs)
+	} else {
+		// add watches in parallel (slow - syscalls)
+		var wg sync.WaitGroup
+
+		// Create work chunks
+		chunkSize := (len(dirs) + workerCount - 1) / workerCount
+
+		for i := 0; i < workerCount; i++ {
+			start := i * chunkSize
+			if start >= len(dirs) {
+				break
 			}
-			atomic.AddInt64(&addedCount, int64(localAdded))
-			atomic.AddInt64(&failCount, int64(localFailed))
-		}(dirs[start:end])
+			end := start + chunkSize
+			if end > len(dirs) {
+				end = len(dirs)
+			}
+
+			wg.Add(1)
+			go func(chunk []string) {
+				defer wg.Done()
+				addChunk(chunk)
+			}(dirs[start:end])
+		}
+
+		wg.Wait()
 	}
 
-	wg.Wait()
+	if pw.stopped() {
+		return errStopped
+	}
 
 	if failCount > 0 {
 		slog.Warn("some watches failed to add", "added", addedCount, "failed", failCount, "root", root)
@@ -327,6 +436,47 @@ func (pw *PlexWatcher) addRecursive(root string) error {
 	return nil
 }
 
+// stopped reports whether Stop has been called.
+func (pw *PlexWatcher) stopped() bool {
+	select {
+	case <-pw.stop:
+		return true
+	default:
+		return false
+	}
+}
+
+// markWatched records dir as having an active watch.
+func (pw *PlexWatcher) markWatched(dir string) {
+	pw.watchedMutex.Lock()
+	pw.watched[filepath.Clean(dir)] = struct{}{}
+	pw.watchedMutex.Unlock()
+}
+
+// unmarkWatched forgets dir and every watched dir below it.
+func (pw *PlexWatcher) unmarkWatched(dir string) {
+	dir = filepath.Clean(dir)
+	prefix := dir + string(filepath.Separator)
+	pw.watchedMutex.Lock()
+	defer pw.watchedMutex.Unlock()
+	if _, ok := pw.watched[dir]; !ok {
+		return // not a watched dir (e.g. a file), nothing below it either
+	}
+	for w := range pw.watched {
+		if w == dir || strings.HasPrefix(w, prefix) {
+			delete(pw.watched, w)
+		}
+	}
+}
+
+// isWatched reports whether dir already has an active watch.
+func (pw *PlexWatcher) isWatched(dir string) bool {
+	pw.watchedMutex.Lock()
+	_, ok := pw.watched[filepath.Clean(dir)]
+	pw.watchedMutex.Unlock()
+	return ok
+}
+
 // =====================
 // utilities
 // =====================
@@ -344,8 +494,3 @@ func ensureDirExists(p string) error {
 	}
 	return nil
 }
-
-func isDir(p string) bool {
-	stat, err := os.Stat(p)
-	return err == nil && stat.IsDir()
-}
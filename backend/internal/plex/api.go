@@ -26,6 +26,15 @@ type PlexClient struct {
 	UserAgent string // optional, can be empty
 }
 
+// plexTransport is shared by every PlexClient so keep-alive connections survive across
+// /start, /scan and /prob-plex requests. The default transport keeps only 2 idle
+// connections per host, fewer than the concurrent scans we allow.
+var plexTransport = func() *http.Transport {
+	t := http.DefaultTransport.(*http.Transport).Clone()
+	t.MaxIdleConnsPerHost = 32
+	return t
+}()
+
 // NewPlexClient creates a new PlexClient with the given base URL and token.
 func NewPlexClient(base, token string) (*PlexClient, error) {
 	if base == "" {
@@ -45,7 +54,8 @@ func NewPlexClient(base, token string) (*PlexClient, error) {
 		BaseURL: parsedURL,
 		Token:   token,
 		HTTP: &http.Client{
-			Timeout: 30 * time.Second,
+			Timeout:   30 * time.Second,
+			Transport: plexTransport,
 		},
 		UserAgent: "PlexWatcherClient/1.0",
 	}, nil
@@ -78,6 +88,14 @@ func (pc *PlexClient) newRequest(ctx context.Context, method string, u *url.URL,
 	return req, nil
 }
 
+// closeBody drains (up to a limit) and closes a response body. Go only returns the
+// connection to the keep-alive pool if the body was read to EOF, so concurrent
+// scans reuse connections instead of dialing Plex again.
+func closeBody(res *http.Response) {
+	io.Copy(io.Discard, io.LimitReader(res.Body, 64<<10))
+	res.Body.Close()
+}
+
 // ======================
 // PUBLIC API
 // ======================
@@ -96,7 +114,7 @@ func (pc *PlexClient) ListSections(ctx context.Context) ([]types.PlexSection, er
 	if err != nil {
 		return nil, err
 	}
-	defer res.Body.Close() // <-- finally: close body
+	defer closeBody(res) // <-- finally: drain & close body
 
 	if res.StatusCode < 200 || res.StatusCode >= 300 {
 		b, _ := io.ReadAll(io.LimitReader(res.Body, 4<<10)) // <-- only return 4096 bytes of message
@@ -160,7 +178,7 @@ func (pc *PlexClient) ScanSectionPath(ctx context.Context, sectionKey int, path
 	if err != nil {
 		return err
 	}
-	defer res.Body.Close()
+	defer closeBody(res)
 
 	if res.StatusCode < 200 || res.StatusCode >= 300 {
 		b, _ := io.ReadAll(io.LimitReader(res.Body, 4<<10)) // <-- only return 4096 bytes of message
@@ -6,10 +6,43 @@ import (
 	"strings"
 )
 
+// plexRoot is a section root pre-split into lowercase path components,
+// so path mapping doesn't re-split and re-lowercase every root per event.
+type plexRoot struct {
+	section types.PlexSection
+	clean   string   // cleaned root path
+	prefix  string   // clean root with a trailing separator, for child-path prefix checks
+	lower   []string // lowercase path components of the root
+}
+
+// newPlexRoots precomputes the path components of each section root.
+// Sections without a root path are skipped.
+func newPlexRoots(sections []types.PlexSection) []plexRoot {
+	roots := make([]plexRoot, 0, len(sections))
+	for _, section := range sections {
+		if section.RootPath == "" {
+			continue
+		}
+		rootParts := splitPathParts(section.RootPath) // empty for "/", which then never suffix-matches
+		clean := filepath.Clean(section.RootPath)
+		prefix := clean
+		if !strings.HasSuffix(prefix, string(filepath.Separator)) {
+			prefix += string(filepath.Separator) // "/" and "C:\" already end with one
+		}
+		roots = append(roots, plexRoot{
+			section: section,
+			clean:   clean,
+			prefix:  prefix,
+			lower:   toLower(rootParts),
+		})
+	}
+	return roots
+}
+
 // MapToPlexPath returns the Plex-visible path for a given local path,
 // using longest suffix matching on path components (case-insensitive).
 // It also returns the matched Plex root. If no root matches, ok=false.
-func mapToPlexPath(localPath string, sectionRoots []types.PlexSection) (mapped string, matchedRoot *types.PlexSection) {
+func mapToPlexPath(localPath string, sectionRoots []plexRoot) (mapped string, matchedRoot *types.PlexSection) {
 	localParts := splitPathParts(localPath)
 	if len(localParts) == 0 {
 		return "", nil // <-- cannot split
@@ -17,22 +50,16 @@ func mapToPlexPath(localPath string, sectionRoots []types.PlexSection) (mapped s
 	localLower := toLower(localParts)
 
 	var (
-		bestK           int
-		bestChildren    []string
-		bestSectionRoot types.PlexSection
+		bestK        int
+		bestChildren []string
+		bestRoot     *plexRoot
 	)
 
-	for _, root := range sectionRoots {
-		if root.RootPath == "" {
-			continue
-		}
-		rootParts := splitPathParts(root.RootPath)
-		if len(rootParts) == 0 {
-			continue // <-- cannot split plex root, proceed to next root
-		}
-		rootLower := toLower(rootParts)
+	for i := range sectionRoots {
+		root := &sectionRoots[i]
+		rootLower := root.lower
 
-		maxK := len(rootParts)
+		maxK := len(rootLower)
 		for k := maxK; k >= 1; k-- {
 			suffix := rootLower[len(rootLower)-k:] // last k part of the root
 			// slide this suffix across the local path
@@ -42,7 +69,7 @@ func mapToPlexPath(localPath string, sectionRoots []types.PlexSection) (mapped s
 					if k > bestK {
 						bestK = k
 						bestChildren = children
-						bestSectionRoot = root
+						bestRoot = root
 					}
 					break // found the best match for this k; no need to check shorter substrings
 				}
@@ -53,19 +80,20 @@ func mapToPlexPath(localPath string, sectionRoots []types.PlexSection) (mapped s
 		}
 	}
 
-	if bestSectionRoot.RootPath == "" {
+	if bestRoot == nil {
 		return "", nil
 	}
 
 	// join using os-native seperators for the mapped results
 	mapped = filepath.Join(append([]string{
-		filepath.Clean(bestSectionRoot.RootPath),
+		bestRoot.clean,
 	}, bestChildren...)...)
 
 	// normalize to forward slashes for Plex compatibility (Plex expects Unix-style paths)
 	mapped = filepath.ToSlash(mapped)
 
-	return mapped, &bestSectionRoot
+	section := bestRoot.section // copy, callers must not mutate the cached root
+	return mapped, &section
 }
 
 func splitPathParts(p string) []string {
@@ -22,6 +22,9 @@ type Scanner struct {
 	// roots contains all library root paths sorted by length (longest first)
 	// This enables proper matching for nested library structures
 	roots []types.PlexSection
+
+	// plexRoots holds roots pre-split for suffix-based path mapping
+	plexRoots []plexRoot
 }
 
 // ===========
@@ -60,9 +63,10 @@ func NewScanner(ctx context.Context, api PlexAPI) (*Scanner, error) {
 	})
 
 	return &Scanner{
-		api:      api,
-		sections: sectionMap,
-		roots:    roots,
+		api:       api,
+		sections:  sectionMap,
+		roots:     roots,
+		plexRoots: newPlexRoots(roots),
 	}, nil
 }
 
@@ -201,17 +205,13 @@ func (s *Scanner) getShowRootPath(path string) string {
 func (s *Scanner) findSection(path string) (*types.PlexSection, error) {
 	cleanPath := filepath.Clean(path)
 
-	// Try to match against each root (already sorted longest-first)
-	for _, root := range s.roots {
-		// Check if path is within this root
-		relPath, err := filepath.Rel(root.RootPath, cleanPath)
-		if err != nil {
-			continue // Not related to this root
-		}
-
-		// If the relative path doesn't start with "..", it's a child of this root
-		if !strings.HasPrefix(relPath, "..") {
-			return &root, nil
+	// Try to match against each root (already sorted longest-first, so the deepest root wins)
+	for i := range s.plexRoots {
+		root := &s.plexRoots[i]
+		// The path is within this root if it is the root itself or starts with "<root>/"
+		if cleanPath == root.clean || strings.HasPrefix(cleanPath, root.prefix) {
+			section := root.section
+			return &section, nil
 		}
 	}
 
@@ -244,11 +244,11 @@ func (s *Scanner) GetAllSections() []types.PlexSection {
 
 // MapToPlexPath maps a local filesystem path to path existed on remote plex server
 func (s *Scanner) MapToPlexPath(localPath string) (mapped string, matchedRoot *types.PlexSection) {
-	if len(s.roots) == 0 {
+	if len(s.plexRoots) == 0 {
 		return "", nil
 	}
 
-	return mapToPlexPath(localPath, s.roots)
+	return mapToPlexPath(localPath, s.plexRoots)
 }
 
 // isDigit checks if a byte represents an ASCII digit.
@@ -22,7 +22,9 @@ func NewManager() *Manager {
 	}
 }
 
-func (m *Manager) Start(req types.RequestStart, handler func(fs_watcher.Event)) error {
+// Start begins watching req.Paths. filter (optional) drops events for paths it rejects
+// before they reach handler.
+func (m *Manager) Start(req types.RequestStart, handler func(fs_watcher.Event), filter func(string) bool) error {
 	m.mutex.Lock()
 	defer m.mutex.Unlock()
 
@@ -42,6 +44,7 @@ func (m *Manager) Start(req types.RequestStart, handler func(fs_watcher.Event))
 		Recursive:      true,
 		DebounceWindow: debounce,
 		Handler:        handler,
+		Filter:         filter,
 	}
 	watcher, err := fs_watcher.NewPlexWatcher(cfg)
 	if err != nil {
@@ -84,7 +87,8 @@ func (m *Manager) Status() (bool, []string, int) {
 	if m.watcher == nil {
 		return false, []string{}, 0
 	}
+	cfg := m.watcher.GetConfig()
 	return m.running, // is running
-		m.watcher.GetConfig().Dirs, // paths being watched
-		int(m.watcher.GetConfig().DebounceWindow.Seconds()) // cooldown in seconds
+		cfg.Dirs, // paths being watched
+		int(cfg.DebounceWindow.Seconds()) // cooldown in seconds
 }